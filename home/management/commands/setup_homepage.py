@@ -1,4 +1,5 @@
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from wagtail.models import Site, Page
 from home.models import HomePage
 
@@ -16,44 +17,49 @@ class Command(BaseCommand):
             )
             return
 
-        # Check if HomePage already exists
-        if HomePage.objects.filter(slug='home').exists():
-            home_page = HomePage.objects.get(slug='home')
-            self.stdout.write(
-                self.style.WARNING('HomePage already exists')
-            )
-        else:
-            # Create HomePage as a child of root
-            home_page = HomePage(
-                title='Amazon Manager',
-                slug='home',
-                body='<p>Welcome to Amazon Manager - your comprehensive solution for managing Amazon operations.</p>'
-            )
-            root.add_child(instance=home_page)
-            self.stdout.write(
-                self.style.SUCCESS('HomePage created successfully')
-            )
+        # Create the HomePage and point the Site at it in a single transaction
+        with transaction.atomic():
+            # Check if HomePage already exists
+            home_page = HomePage.objects.filter(slug='home').first()
+            if home_page is not None:
+                self.stdout.write(
+                    self.style.WARNING('HomePage already exists')
+                )
+            else:
+                # Create HomePage as a child of root
+                home_page = HomePage(
+                    title='Amazon Manager',
+                    slug='home',
+                    body='<p>Welcome to Amazon Manager - your comprehensive solution for managing Amazon operations.</p>'
+                )
+                root.add_child(instance=home_page)
+                self.stdout.write(
+                    self.style.SUCCESS('HomePage created successfully')
+                )
 
-        # Set up the site to point to our HomePage
-        try:
-            site = Site.objects.get(is_default_site=True)
-            site.root_page = home_page
-            site.save()
-            self.stdout.write(
-                self.style.SUCCESS('Site updated to use HomePage as root')
-            )
-        except Site.DoesNotExist:
-            site = Site.objects.create(
-                hostname='localhost',
-                port=8000,
-                site_name='Amazon Manager',
-                root_page=home_page,
-                is_default_site=True
-            )
-            self.stdout.write(
-                self.style.SUCCESS('Site created successfully')
+            # Set up the site to point to our HomePage; only root_page is
+            # changed on an existing site, so avoid loading the other columns
+            site, created = Site.objects.only(
+                'id', 'root_page', 'is_default_site'
+            ).update_or_create(
+                is_default_site=True,
+                defaults={'root_page': home_page},
+                create_defaults={
+                    'hostname': 'localhost',
+                    'port': 8000,
+                    'site_name': 'Amazon Manager',
+                    'root_page': home_page,
+                }
             )
+            if created:
+                self.stdout.write(
+                    self.style.SUCCESS('Site created successfully')
+                )
+            else:
+                self.stdout.write(
+                    self.style.SUCCESS('Site updated to use HomePage as root')
+                )
 
         self.stdout.write(
             self.style.SUCCESS('Site setup completed successfully')
-        )
\ No newline at end of file
+        )
@@ -8,9 +8,74 @@ from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from django.test import LiveServerTestCase
-from django.contrib.staticfiles.testing import StaticLiveServerTestCase
+from selenium.common.exceptions import TimeoutException
+import atexit
 import os
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Directory where debugging screenshots and page sources are written
+SCREENSHOTS_DIR = "test_screenshots"
+
+# Step screenshots are saved as JPEG by default; set to "png" for lossless output
+SCREENSHOT_FORMAT = os.environ.get("AMZMGR_SCREENSHOT_FORMAT", "jpg").lower()
+SUPPORTED_SCREENSHOT_FORMATS = ("png", "jpg", "jpeg")
+
+# Failure artifacts are written in the background so disk I/O stays off the
+# report path; pending writes are flushed before the interpreter exits
+_artifact_writer = ThreadPoolExecutor(max_workers=2)
+atexit.register(_artifact_writer.shutdown, wait=True)
+
+
+def _write_artifact(path, data):
+    """Write a bytes or str artifact to disk."""
+    if isinstance(data, bytes):
+        with open(path, 'wb') as f:
+            f.write(data)
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(data)
+
+
+def _submit_artifact(path, data):
+    """
+    Write an artifact in the background. The write finishes after the test's
+    report, so failures are raised as warnings to appear in the summary.
+    """
+    def report_error(future):
+        error = future.exception()
+        if error is not None:
+            warnings.warn(f"Failed to save test artifact {path}: {error}")
+    
+    _artifact_writer.submit(_write_artifact, path, data).add_done_callback(report_error)
+
+
+# Window size used for the desktop viewport
+DESKTOP_WINDOW_SIZE = (1920, 1080)
+
+# Locators for elements on the homepage, shared by the Selenium tests
+PAGE_TITLE = (By.CSS_SELECTOR, '[data-testid="page-title"]')
+WELCOME_MESSAGE = (By.CSS_SELECTOR, '[data-testid="welcome-message"]')
+ALPINE_BUTTON = (By.CSS_SELECTOR, '[data-testid="alpine-button"]')
+ALPINE_MESSAGE = (By.CSS_SELECTOR, '[data-testid="alpine-message"]')
+HTMX_BUTTON = (By.CSS_SELECTOR, '[data-testid="htmx-button"]')
+# The result container has a stable id, so use the faster ID lookup
+HTMX_RESULT = (By.ID, 'htmx-result')
+
+
+def _get_wait(driver, timeout=20):
+    """
+    Return a WebDriverWait for the driver, reusing one per timeout.
+    Waits are cached on the driver so they live as long as the browser does.
+    """
+    waits = getattr(driver, "_cached_waits", None)
+    if waits is None:
+        waits = driver._cached_waits = {}
+    if timeout not in waits:
+        waits[timeout] = WebDriverWait(driver, timeout)
+    return waits[timeout]
 
 
 def pytest_addoption(parser):
@@ -29,6 +94,12 @@ def pytest_addoption(parser):
     )
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _ensure_screenshots_dir():
+    """Create the screenshots directory once per test session."""
+    os.makedirs(SCREENSHOTS_DIR, exist_ok=True)
+
+
 @pytest.fixture(scope="session")
 def browser_name(request):
     """Get browser name from command line."""
@@ -41,75 +112,162 @@ def headless_mode(request):
     return request.config.getoption("--headless")
 
 
-@pytest.fixture(scope="function")
-def driver(browser_name, headless_mode):
+@pytest.fixture(scope="session")
+def _driver_session(request, browser_name, headless_mode):
     """
     Create a WebDriver instance based on browser selection.
-    Uses function scope to ensure each test gets a fresh browser instance.
+    Uses session scope so the browser is launched only once per test run.
+    Under pytest-xdist every worker has its own session, and therefore its
+    own browser.
     """
-    driver_instance = None
-    
-    try:
-        if browser_name.lower() == "chrome" or browser_name.lower() == "headless-chrome":
-            options = ChromeOptions()
-            
-            # Configure Chrome options
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--disable-gpu")
-            options.add_argument("--window-size=1920,1080")
-            
-            if headless_mode or browser_name.lower() == "headless-chrome":
-                options.add_argument("--headless=new")
-            
-            driver_instance = webdriver.Chrome(options=options)
-            
-        elif browser_name.lower() == "firefox":
-            options = FirefoxOptions()
-            
-            if headless_mode:
-                options.add_argument("--headless")
-                
-            driver_instance = webdriver.Firefox(options=options)
-            
-        else:
-            raise ValueError(f"Unsupported browser: {browser_name}")
-            
-        # Configure implicit wait
-        driver_instance.implicitly_wait(10)
+    if browser_name.lower() == "chrome" or browser_name.lower() == "headless-chrome":
+        options = ChromeOptions()
         
-        # Maximize window for consistent behavior
-        driver_instance.maximize_window()
+        # Return from driver.get() at DOMContentLoaded instead of the load event
+        options.page_load_strategy = "eager"
+        
+        # Configure Chrome options
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--window-size={},{}".format(*DESKTOP_WINDOW_SIZE))
         
-        yield driver_instance
+        # Skip background services that slow down browser startup
+        options.add_argument(
+            "--disable-features=Translate,BackForwardCache,OptimizationHints,MediaRouter"
+        )
+        options.add_argument("--disable-background-networking")
+        options.add_argument("--disable-sync")
+        options.add_argument("--disable-default-apps")
+        options.add_argument("--no-first-run")
+        options.add_argument("--disable-extensions")
         
-    finally:
-        if driver_instance:
-            driver_instance.quit()
+        if headless_mode or browser_name.lower() == "headless-chrome":
+            options.add_argument("--headless=new")
+        
+        driver_instance = webdriver.Chrome(options=options)
+        request.addfinalizer(driver_instance.quit)
+        
+        # Skip images and fonts; assertions only inspect text, attributes and
+        # CSS, so stylesheets are left unblocked
+        driver_instance.execute_cdp_cmd("Network.enable", {})
+        driver_instance.execute_cdp_cmd("Network.setBlockedURLs", {
+            "urls": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.ico", "*.woff", "*.woff2"]
+        })
+        
+    elif browser_name.lower() == "firefox":
+        options = FirefoxOptions()
+        options.page_load_strategy = "eager"
+        
+        options.add_argument("--width={}".format(DESKTOP_WINDOW_SIZE[0]))
+        options.add_argument("--height={}".format(DESKTOP_WINDOW_SIZE[1]))
+        
+        if headless_mode:
+            options.add_argument("--headless")
+            
+        driver_instance = webdriver.Firefox(options=options)
+        request.addfinalizer(driver_instance.quit)
+        
+    else:
+        raise ValueError(f"Unsupported browser: {browser_name}")
+        
+    # Disable implicit waits; tests rely on explicit WebDriverWait conditions,
+    # and mixing both multiplies timeouts on missing elements
+    driver_instance.implicitly_wait(0)
+    
+    # Maximize window for consistent behavior; headless browsers start at
+    # DESKTOP_WINDOW_SIZE, so skip the extra round-trip there
+    if not (headless_mode or browser_name.lower() == "headless-chrome"):
+        driver_instance.maximize_window()
+    
+    return driver_instance
+
+
+@pytest.fixture(scope="function")
+def driver(_driver_session):
+    """
+    Provide the shared WebDriver instance to a test.
+    Cookies and web storage are cleared after each test. The loaded page is
+    kept so class-scoped page fixtures can share one navigation across tests.
+    """
+    driver_instance = _driver_session
+    
+    yield driver_instance
+    
+    # Reset browser state for the next test
+    try:
+        driver_instance.execute_script(
+            "window.localStorage.clear(); window.sessionStorage.clear();"
+        )
+    except Exception:
+        # Storage is not accessible on some pages (e.g. about:blank)
+        pass
+    driver_instance.delete_all_cookies()
+    
+    # Restore the desktop viewport if the test changed it
+    if getattr(driver_instance, "_viewport_overridden", False):
+        BaseSeleniumTest().reset_viewport_size(driver_instance)
 
 
 @pytest.fixture(scope="function")
 def wait(driver):
     """Create WebDriverWait instance for explicit waits."""
-    return WebDriverWait(driver, 20)
+    return _get_wait(driver, 20)
 
 
 # We'll use pytest-django's built-in live_server fixture instead of defining our own
 
 
 @pytest.fixture(scope="function")
-def page_elements():
-    """Common page element selectors."""
-    return {
-        'homepage': {
-            'title': '[data-testid="page-title"]',
-            'welcome_message': '[data-testid="welcome-message"]',
-            'alpine_button': '[data-testid="alpine-button"]',
-            'alpine_message': '[data-testid="alpine-message"]',
-            'htmx_button': '[data-testid="htmx-button"]',
-            'htmx_result': '[data-testid="htmx-result"]',
-        }
-    }
+def wagtail_root(db):
+    """
+    Provide the Wagtail root page with no pages below it.
+    Tests run with --nomigrations, so the locale and root page that Wagtail's
+    migrations normally create are added here. When migrations did run, the
+    default welcome page (and its Site) is removed, since its 'home' slug
+    would clash with the HomePage created by setup_homepage.
+    """
+    from django.conf import settings
+    from wagtail.coreutils import get_supported_content_language_variant
+    from wagtail.models import Locale, Page
+    
+    Locale.objects.get_or_create(
+        language_code=get_supported_content_language_variant(settings.LANGUAGE_CODE)
+    )
+    root = Page.objects.filter(depth=1).first()
+    if root is None:
+        return Page.add_root(instance=Page(title='Root', slug='root'))
+    
+    Page.objects.filter(depth__gt=1).delete()
+    root.refresh_from_db()
+    return root
+
+
+@pytest.fixture(scope="function")
+def homepage(wagtail_root):
+    """
+    Create the Wagtail HomePage and make it the default Site root using the
+    setup_homepage management command.
+    """
+    from io import StringIO
+    from django.core.management import call_command
+    from home.models import HomePage
+    
+    call_command('setup_homepage', stdout=StringIO())
+    return HomePage.objects.get(slug='home')
+
+
+@pytest.fixture(scope="class")
+def loaded_homepage(_driver_session, live_server):
+    """
+    Load the homepage once and share it across the tests in a class.
+    Tests that change the page are responsible for restoring its state.
+    """
+    _driver_session.get(f"{live_server.url}")
+    BaseSeleniumTest().wait_for_homepage_ready(_driver_session)
+    
+    yield _driver_session
+    
+    _driver_session.get("about:blank")
 
 
 @pytest.fixture(scope="function")
@@ -137,38 +295,84 @@ class BaseSeleniumTest:
     
     def wait_for_element(self, driver, locator, timeout=20):
         """Wait for element to be present and visible."""
-        wait = WebDriverWait(driver, timeout)
+        wait = _get_wait(driver, timeout)
         return wait.until(
             EC.presence_of_element_located(locator)
         )
     
     def wait_for_element_clickable(self, driver, locator, timeout=20):
         """Wait for element to be clickable."""
-        wait = WebDriverWait(driver, timeout)
+        wait = _get_wait(driver, timeout)
         return wait.until(
             EC.element_to_be_clickable(locator)
         )
     
     def wait_for_text_in_element(self, driver, locator, text, timeout=20):
         """Wait for specific text to appear in element."""
-        wait = WebDriverWait(driver, timeout)
+        wait = _get_wait(driver, timeout)
         return wait.until(
             EC.text_to_be_present_in_element(locator, text)
         )
     
+    def _save_png(self, png, filename):
+        """Write PNG screenshot data to disk, re-encoding as JPEG if configured."""
+        # Checked here rather than at startup so an unsupported value only
+        # affects runs that actually take screenshots
+        if SCREENSHOT_FORMAT not in SUPPORTED_SCREENSHOT_FORMATS:
+            raise ValueError(
+                f"Unsupported AMZMGR_SCREENSHOT_FORMAT {SCREENSHOT_FORMAT!r}; "
+                f"use one of: {', '.join(SUPPORTED_SCREENSHOT_FORMATS)}"
+            )
+        if SCREENSHOT_FORMAT in ("jpg", "jpeg"):
+            from io import BytesIO
+            from PIL import Image
+            
+            Image.open(BytesIO(png)).convert("RGB").save(
+                filename, "JPEG", quality=70, optimize=False
+            )
+        else:
+            with open(filename, 'wb') as f:
+                f.write(png)
+    
+    def expect_htmx_event(self, driver, event="htmx:afterSwap", target=None):
+        """
+        Start listening for the next HTMX event on target (the document body by
+        default; events bubble up from the triggering element). Call this
+        before triggering the request so a fast response cannot complete
+        before the listener exists.
+        """
+        driver.execute_script("""
+            var event = arguments[0];
+            var target = arguments[1] || document.body;
+            window.__htmxEvent = new Promise(function (resolve) {
+                target.addEventListener(event, function () {
+                    resolve();
+                }, {once: true});
+            });
+        """, event, target)
+    
+    def wait_for_htmx_event(self, driver, timeout=10):
+        """Wait for the event registered by expect_htmx_event to fire."""
+        fired = driver.execute_async_script("""
+            var done = arguments[arguments.length - 1];
+            var timer = setTimeout(function () { done(false); }, arguments[0]);
+            window.__htmxEvent.then(function () {
+                clearTimeout(timer);
+                done(true);
+            });
+        """, timeout * 1000)
+        if not fired:
+            raise TimeoutException(f"No HTMX event fired within {timeout}s")
+    
     def take_screenshot(self, driver, name="screenshot"):
         """Take a screenshot for debugging."""
-        import datetime
-        screenshots_dir = "test_screenshots"
-        os.makedirs(screenshots_dir, exist_ok=True)
-        
         # Add timestamp to screenshot name for uniqueness
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{screenshots_dir}/{name}_{timestamp}.png"
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        filename = f"{SCREENSHOTS_DIR}/{name}_{timestamp}.{SCREENSHOT_FORMAT}"
         
         # Take full page screenshot if possible
         try:
-            driver.save_screenshot(filename)
+            self._save_png(driver.get_screenshot_as_png(), filename)
             print(f"Screenshot saved: {filename}")
         except Exception as e:
             print(f"Failed to take screenshot: {e}")
@@ -177,15 +381,11 @@ class BaseSeleniumTest:
     
     def take_element_screenshot(self, driver, element, name="element_screenshot"):
         """Take a screenshot of a specific element."""
-        import datetime
-        screenshots_dir = "test_screenshots"
-        os.makedirs(screenshots_dir, exist_ok=True)
-        
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{screenshots_dir}/{name}_{timestamp}.png"
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        filename = f"{SCREENSHOTS_DIR}/{name}_{timestamp}.{SCREENSHOT_FORMAT}"
         
         try:
-            element.screenshot(filename)
+            self._save_png(element.screenshot_as_png, filename)
             print(f"Element screenshot saved: {filename}")
         except Exception as e:
             print(f"Failed to take element screenshot: {e}")
@@ -196,11 +396,54 @@ class BaseSeleniumTest:
         """Scroll element into view."""
         driver.execute_script("arguments[0].scrollIntoView(true);", element)
     
+    def set_viewport_size(self, driver, width, height, mobile=False):
+        """
+        Resize the viewport. Chromium drivers use CDP device emulation, which
+        resizes the renderer without an OS window operation; other browsers
+        fall back to resizing the window.
+        """
+        if hasattr(driver, "execute_cdp_cmd"):
+            driver.execute_cdp_cmd("Emulation.setDeviceMetricsOverride", {
+                "width": width,
+                "height": height,
+                "deviceScaleFactor": 0,
+                "mobile": mobile,
+            })
+        else:
+            driver.set_window_size(width, height)
+        driver._viewport_overridden = True
+    
+    def reset_viewport_size(self, driver):
+        """
+        Undo set_viewport_size and return to the desktop viewport. The driver
+        fixture calls this automatically after tests that changed the viewport.
+        """
+        if hasattr(driver, "execute_cdp_cmd"):
+            driver.execute_cdp_cmd("Emulation.clearDeviceMetricsOverride", {})
+        else:
+            driver.set_window_size(*DESKTOP_WINDOW_SIZE)
+        driver._viewport_overridden = False
+    
     def wait_for_page_load(self, driver, timeout=30):
-        """Wait for page to finish loading."""
-        wait = WebDriverWait(driver, timeout)
+        """
+        Wait until DOMContentLoaded has finished. The eager page load strategy
+        returns before deferred scripts run, so readyState alone is not enough;
+        images and other subresources may still be loading.
+        """
+        wait = _get_wait(driver, timeout)
+        wait.until(
+            lambda driver: driver.execute_script("""
+                const nav = performance.getEntriesByType('navigation')[0];
+                return !!(nav && nav.domContentLoadedEventEnd > 0);
+            """)
+        )
+    
+    def wait_for_homepage_ready(self, driver, timeout=30):
+        """Wait for the homepage to load and Alpine.js and HTMX to initialise."""
+        self.wait_for_page_load(driver, timeout)
+        wait = _get_wait(driver, timeout)
         wait.until(
-            lambda driver: driver.execute_script("return document.readyState") == "complete"
+            lambda driver: driver.execute_script("return !!(window.Alpine && window.htmx)")
         )
 
 
@@ -215,24 +458,20 @@ def pytest_runtest_makereport(item, call):
         if hasattr(item, 'funcargs') and 'driver' in item.funcargs:
             driver = item.funcargs['driver']
             
-            # Create screenshots directory
-            screenshots_dir = "test_screenshots"
-            os.makedirs(screenshots_dir, exist_ok=True)
-            
             # Generate screenshot filename
-            import datetime
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
             test_name = item.nodeid.replace("::", "_").replace("/", "_")
-            filename = f"{screenshots_dir}/FAILED_{test_name}_{timestamp}.png"
+            filename = f"{SCREENSHOTS_DIR}/FAILED_{test_name}_{timestamp}.png"
             
             try:
-                driver.save_screenshot(filename)
+                # Capture from the browser now, write to disk in the background
+                png = driver.get_screenshot_as_png()
+                _submit_artifact(filename, png)
                 print(f"\n📸 Failure screenshot saved: {filename}")
                 
                 # Also capture page source for debugging
-                source_filename = f"{screenshots_dir}/FAILED_{test_name}_{timestamp}_source.html"
-                with open(source_filename, 'w', encoding='utf-8') as f:
-                    f.write(driver.page_source)
+                source_filename = f"{SCREENSHOTS_DIR}/FAILED_{test_name}_{timestamp}_source.html"
+                _submit_artifact(source_filename, driver.page_source)
                 print(f"📄 Page source saved: {source_filename}")
                 
             except Exception as e:
@@ -241,7 +480,16 @@ def pytest_runtest_makereport(item, call):
 
 @pytest.fixture(scope="function", autouse=True)
 def auto_screenshot_on_steps(request):
-    """Automatically take screenshots at key test steps."""
+    """
+    Automatically take screenshots at key test steps.
+    Disabled unless AMZMGR_CAPTURE_ALL_SCREENSHOTS is set; failure screenshots
+    are always captured by pytest_runtest_makereport.
+    """
+    # Only capture step screenshots when explicitly requested
+    if not os.environ.get("AMZMGR_CAPTURE_ALL_SCREENSHOTS"):
+        yield
+        return
+    
     # Check if this test uses the driver fixture
     if 'driver' not in request.fixturenames:
         yield
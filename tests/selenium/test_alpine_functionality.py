@@ -7,96 +7,110 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
-from tests.conftest import BaseSeleniumTest
+from tests.conftest import (
+    BaseSeleniumTest,
+    ALPINE_BUTTON,
+    ALPINE_MESSAGE,
+    HTMX_BUTTON,
+)
 
 
 @pytest.mark.selenium
 class TestAlpineFunctionality(BaseSeleniumTest):
     """Test cases for Alpine.js reactive components."""
     
-    def test_alpine_library_loaded(self, driver, live_server):
-        """Test that Alpine.js library is properly loaded."""
-        driver.get(f"{live_server.url}")
-        self.wait_for_page_load(driver)
-        
-        # Check if Alpine is available in the global scope
-        alpine_available = driver.execute_script("return typeof Alpine !== 'undefined'")
-        assert alpine_available, "Alpine.js library is not loaded"
-        
-        # Check Alpine version (if available)
-        alpine_version = driver.execute_script("return Alpine.version || 'unknown'")
-        print(f"Alpine.js version: {alpine_version}")  # For debugging
-        
-    def test_alpine_components_initialized(self, driver, live_server):
-        """Test that Alpine.js components are properly initialized."""
-        driver.get(f"{live_server.url}")
-        self.wait_for_page_load(driver)
+    def reset_alpine_state(self, driver):
+        """Restore the Alpine.js demo component to its initial state."""
+        driver.execute_async_script("""
+            const done = arguments[arguments.length - 1];
+            const el = document.querySelector('[x-data]');
+            if (!window.Alpine || !el) {
+                throw new Error('Alpine.js component is not initialised');
+            }
+            Alpine.$data(el).message = 'Hello World from Alpine.js!';
+            Alpine.nextTick(done);
+        """)
+    
+    def test_alpine_static_dom(self, driver, loaded_homepage):
+        """Test that Alpine.js is loaded and the demo component renders correctly."""
+        self.reset_alpine_state(driver)
+        
+        # Check if Alpine is available in the global scope, and its version
+        alpine = driver.execute_script("""
+            const loaded = typeof Alpine !== 'undefined';
+            return {
+                loaded: loaded,
+                version: loaded ? (Alpine.version || 'unknown') : null
+            };
+        """)
+        assert alpine['loaded'], "Alpine.js library is not loaded"
+        print(f"Alpine.js version: {alpine['version']}")  # For debugging
         
-        # Find the Alpine.js component container
+        # Check that the component container is initialized and visible
         alpine_container = self.wait_for_element(
             driver,
             (By.XPATH, "//*[@x-data]")
         )
-        
         assert alpine_container.is_displayed()
         
-        # Check that x-data attribute exists
-        x_data = alpine_container.get_attribute("x-data")
-        assert x_data is not None, "x-data attribute not found"
-        assert "message" in x_data, "message property not found in x-data"
+        # Check initial message
+        message_element = driver.find_element(*ALPINE_MESSAGE)
+        assert "Hello World from Alpine.js!" in message_element.text
         
-    def test_alpine_initial_state(self, driver, live_server):
-        """Test the initial state of Alpine.js components."""
-        driver.get(f"{live_server.url}")
-        self.wait_for_page_load(driver)
+        # Check that the button is usable
+        alpine_button = self.wait_for_element_clickable(driver, ALPINE_BUTTON)
+        assert alpine_button.is_displayed()
+        assert alpine_button.is_enabled()
+        assert "Click me (Alpine.js)" in alpine_button.text
         
-        # Find the message display element
-        message_element = self.wait_for_element(
-            driver,
-            (By.CSS_SELECTOR, '[data-testid="alpine-message"]')
-        )
+        # Read all directive attributes in a single round-trip
+        directives = driver.execute_script("""
+            const attr = (selector, name) => document.querySelector(selector).getAttribute(name);
+            return {
+                x_data: attr('[x-data]', 'x-data'),
+                x_text: attr('[data-testid="alpine-message"]', 'x-text'),
+                click: attr('[data-testid="alpine-button"]', '@click')
+            };
+        """)
         
-        # Check initial message
-        initial_message = message_element.text
-        assert "Hello World from Alpine.js!" in initial_message
+        # Check x-data directive
+        assert directives['x_data'] is not None, "x-data attribute not found"
+        assert "message:" in directives['x_data']
+        assert "Hello World from Alpine.js!" in directives['x_data']
         
-        # Verify x-text attribute
-        x_text = message_element.get_attribute("x-text")
-        assert x_text == "message", "x-text attribute incorrect"
+        # Check x-text directive
+        assert directives['x_text'] == "message", "x-text attribute incorrect"
         
-    def test_alpine_button_exists_and_clickable(self, driver, live_server):
-        """Test that the Alpine.js demo button exists and is clickable."""
-        driver.get(f"{live_server.url}")
-        self.wait_for_page_load(driver)
+        # Check @click directive
+        assert directives['click'] is not None, "@click attribute not found"
+        assert "message =" in directives['click']
+        assert "Alpine.js is working!" in directives['click'], "@click directive incorrect"
         
-        # Find the Alpine.js button
-        alpine_button = self.wait_for_element_clickable(
-            driver,
-            (By.CSS_SELECTOR, '[data-testid="alpine-button"]')
-        )
+        # Test that the data binding works by checking the actual data
+        alpine_data = driver.execute_script("""
+            const alpineEl = document.querySelector('[x-data]');
+            return alpineEl._x_dataStack ? alpineEl._x_dataStack[0] : null;
+        """)
         
-        assert alpine_button.is_displayed()
-        assert alpine_button.is_enabled()
-        assert "Click me (Alpine.js)" in alpine_button.text
+        # This might return None if Alpine internal structure is different
+        # The test is mainly to verify that Alpine.js is functioning
+        if alpine_data:
+            assert 'message' in alpine_data
         
-        # Check Alpine.js click directive
-        click_attr = alpine_button.get_attribute("@click")
-        assert click_attr is not None, "@click attribute not found"
-        assert "Alpine.js is working!" in click_attr, "@click directive incorrect"
+        # Verify each component has its own scope
+        alpine_components = driver.find_elements(By.XPATH, "//*[@x-data]")
+        assert len(alpine_components) >= 1, "No Alpine.js components found"
+        for component in alpine_components:
+            x_data = component.get_attribute("x-data")
+            assert x_data is not None and x_data.strip() != ""
         
-    def test_alpine_reactivity(self, driver, live_server):
+    def test_alpine_reactivity(self, driver, loaded_homepage):
         """Test Alpine.js reactivity when button is clicked."""
-        driver.get(f"{live_server.url}")
-        self.wait_for_page_load(driver)
+        self.reset_alpine_state(driver)
         
         # Find elements
-        alpine_button = self.wait_for_element_clickable(
-            driver,
-            (By.CSS_SELECTOR, '[data-testid="alpine-button"]')
-        )
-        message_element = driver.find_element(
-            By.CSS_SELECTOR, '[data-testid="alpine-message"]'
-        )
+        alpine_button = self.wait_for_element_clickable(driver, ALPINE_BUTTON)
+        message_element = driver.find_element(*ALPINE_MESSAGE)
         
         # Check initial state
         initial_message = message_element.text
@@ -122,87 +136,34 @@ class TestAlpineFunctionality(BaseSeleniumTest):
             current_message = message_element.text
             assert False, f"Alpine.js reactivity failed. Message remained: '{current_message}'"
             
-    def test_alpine_multiple_interactions(self, driver, live_server):
+    def test_alpine_multiple_interactions(self, driver, loaded_homepage):
         """Test multiple interactions with Alpine.js components."""
-        driver.get(f"{live_server.url}")
-        self.wait_for_page_load(driver)
-        
-        alpine_button = self.wait_for_element_clickable(
-            driver,
-            (By.CSS_SELECTOR, '[data-testid="alpine-button"]')
-        )
-        message_element = driver.find_element(
-            By.CSS_SELECTOR, '[data-testid="alpine-message"]'
-        )
-        
-        # Test multiple clicks
-        for i in range(3):
-            alpine_button.click()
-            
-            # Wait for message to update
-            WebDriverWait(driver, 5).until(
-                lambda d: "Alpine.js is working!" in message_element.text
-            )
-            
-            assert "Alpine.js is working!" in message_element.text
-            
-            # Small delay between clicks
-            time.sleep(0.3)
-            
-    def test_alpine_data_binding(self, driver, live_server):
-        """Test Alpine.js data binding and reactivity."""
-        driver.get(f"{live_server.url}")
-        self.wait_for_page_load(driver)
-        
-        # Test that the data binding works by checking the actual data
-        alpine_data = driver.execute_script("""
-            const alpineEl = document.querySelector('[x-data]');
-            return alpineEl._x_dataStack ? alpineEl._x_dataStack[0] : null;
+        self.reset_alpine_state(driver)
+        
+        self.wait_for_element_clickable(driver, ALPINE_BUTTON)
+        
+        # Click the button several times in the browser and read the message
+        # once Alpine has flushed its updates; the WebDriver click path is
+        # covered by test_alpine_reactivity
+        final_message = driver.execute_async_script("""
+            const done = arguments[arguments.length - 1];
+            const button = document.querySelector('[data-testid="alpine-button"]');
+            for (let i = 0; i < 3; i++) {
+                button.click();
+            }
+            Alpine.nextTick(() => {
+                done(document.querySelector('[data-testid="alpine-message"]').textContent);
+            });
         """)
         
-        # This might return None if Alpine internal structure is different
-        # The test is mainly to verify that Alpine.js is functioning
-        if alpine_data:
-            assert 'message' in alpine_data
-            
-    def test_alpine_directive_attributes(self, driver, live_server):
-        """Test that Alpine.js directives are properly set."""
-        driver.get(f"{live_server.url}")
-        self.wait_for_page_load(driver)
-        
-        # Check x-data directive
-        container = driver.find_element(By.XPATH, "//*[@x-data]")
-        x_data = container.get_attribute("x-data")
-        assert "message:" in x_data
-        assert "Hello World from Alpine.js!" in x_data
-        
-        # Check x-text directive
-        message_element = driver.find_element(
-            By.CSS_SELECTOR, '[data-testid="alpine-message"]'
-        )
-        x_text = message_element.get_attribute("x-text")
-        assert x_text == "message"
+        assert "Alpine.js is working!" in final_message
         
-        # Check @click directive
-        button_element = driver.find_element(
-            By.CSS_SELECTOR, '[data-testid="alpine-button"]'
-        )
-        click_directive = button_element.get_attribute("@click")
-        assert "message =" in click_directive
-        assert "Alpine.js is working!" in click_directive
-        
-    def test_alpine_state_persistence(self, driver, live_server):
+    def test_alpine_state_persistence(self, driver, loaded_homepage):
         """Test that Alpine.js state persists during interactions."""
-        driver.get(f"{live_server.url}")
-        self.wait_for_page_load(driver)
+        self.reset_alpine_state(driver)
         
-        alpine_button = self.wait_for_element_clickable(
-            driver,
-            (By.CSS_SELECTOR, '[data-testid="alpine-button"]')
-        )
-        message_element = driver.find_element(
-            By.CSS_SELECTOR, '[data-testid="alpine-message"]'
-        )
+        alpine_button = self.wait_for_element_clickable(driver, ALPINE_BUTTON)
+        message_element = driver.find_element(*ALPINE_MESSAGE)
         
         # Click button to change state
         alpine_button.click()
@@ -221,9 +182,7 @@ class TestAlpineFunctionality(BaseSeleniumTest):
         
         # Click other elements to test state isolation
         try:
-            htmx_button = driver.find_element(
-                By.CSS_SELECTOR, '[data-testid="htmx-button"]'
-            )
+            htmx_button = driver.find_element(*HTMX_BUTTON)
             htmx_button.click()
             time.sleep(1)
             
@@ -233,19 +192,3 @@ class TestAlpineFunctionality(BaseSeleniumTest):
         except Exception:
             # HTMX button interaction failed, but Alpine state should still persist
             assert "Alpine.js is working!" in message_element.text
-            
-    def test_alpine_component_isolation(self, driver, live_server):
-        """Test that Alpine.js components are properly isolated."""
-        driver.get(f"{live_server.url}")
-        self.wait_for_page_load(driver)
-        
-        # Find all Alpine components on the page
-        alpine_components = driver.find_elements(By.XPATH, "//*[@x-data]")
-        
-        # For our current setup, we should have one Alpine component
-        assert len(alpine_components) >= 1, "No Alpine.js components found"
-        
-        # Verify each component has its own scope
-        for component in alpine_components:
-            x_data = component.get_attribute("x-data")
-            assert x_data is not None and x_data.strip() != ""
\ No newline at end of file
@@ -3,10 +3,16 @@ Comprehensive Selenium test with extensive screenshot capture.
 """
 import pytest
 import time
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from tests.conftest import BaseSeleniumTest
+from tests.conftest import (
+    BaseSeleniumTest,
+    PAGE_TITLE,
+    ALPINE_BUTTON,
+    ALPINE_MESSAGE,
+    HTMX_BUTTON,
+    HTMX_RESULT,
+)
 
 
 @pytest.mark.selenium
@@ -19,27 +25,19 @@ class TestFullDemoWithScreenshots(BaseSeleniumTest):
         # Step 1: Navigate to homepage
         print("🔍 Step 1: Navigating to homepage...")
         driver.get(f"{live_server.url}")
-        self.wait_for_page_load(driver)
+        self.wait_for_homepage_ready(driver)
         self.take_screenshot(driver, "01_homepage_loaded")
         
         # Step 2: Verify page structure
         print("🔍 Step 2: Verifying page structure...")
-        title_element = self.wait_for_element(
-            driver, 
-            (By.CSS_SELECTOR, '[data-testid="page-title"]')
-        )
+        title_element = self.wait_for_element(driver, PAGE_TITLE)
         assert "Amazon Manager" in title_element.text
         self.take_screenshot(driver, "02_page_structure_verified")
         
         # Step 3: Capture Alpine.js demo section
         print("🔍 Step 3: Testing Alpine.js functionality...")
-        alpine_button = self.wait_for_element_clickable(
-            driver,
-            (By.CSS_SELECTOR, '[data-testid="alpine-button"]')
-        )
-        alpine_message = driver.find_element(
-            By.CSS_SELECTOR, '[data-testid="alpine-message"]'
-        )
+        alpine_button = self.wait_for_element_clickable(driver, ALPINE_BUTTON)
+        alpine_message = driver.find_element(*ALPINE_MESSAGE)
         
         # Take screenshot of Alpine section
         self.take_element_screenshot(driver, alpine_button, "03_alpine_button_before_click")
@@ -64,12 +62,8 @@ class TestFullDemoWithScreenshots(BaseSeleniumTest):
         
         # Step 5: Test HTMX functionality
         print("🔍 Step 5: Testing HTMX functionality...")
-        htmx_button = driver.find_element(
-            By.CSS_SELECTOR, '[data-testid="htmx-button"]'
-        )
-        htmx_result = driver.find_element(
-            By.CSS_SELECTOR, '[data-testid="htmx-result"]'
-        )
+        htmx_button = driver.find_element(*HTMX_BUTTON)
+        htmx_result = driver.find_element(*HTMX_RESULT)
         
         # Take screenshot before HTMX interaction
         self.take_element_screenshot(driver, htmx_button, "07_htmx_button_before_click")
@@ -80,15 +74,12 @@ class TestFullDemoWithScreenshots(BaseSeleniumTest):
         
         # Click HTMX button
         print("🔍 Step 6: Clicking HTMX button...")
+        self.expect_htmx_event(driver)
         htmx_button.click()
         
         # Wait for HTMX to load content
-        self.wait_for_text_in_element(
-            driver,
-            (By.CSS_SELECTOR, '[data-testid="htmx-result"]'),
-            "HTMX is working!",
-            timeout=10
-        )
+        self.wait_for_htmx_event(driver, timeout=10)
+        assert "HTMX is working!" in htmx_result.text
         
         # Capture HTMX updated state
         self.take_screenshot(driver, "09_htmx_after_click")
@@ -99,30 +90,30 @@ class TestFullDemoWithScreenshots(BaseSeleniumTest):
         
         # Click Alpine.js button again
         alpine_button.click()
-        time.sleep(0.5)
+        WebDriverWait(driver, 5).until(
+            lambda d: "Alpine.js is working!" in alpine_message.text
+        )
         self.take_screenshot(driver, "11_alpine_second_click")
         
         # Click HTMX button again
+        self.expect_htmx_event(driver)
         htmx_button.click()
-        time.sleep(1)
+        self.wait_for_htmx_event(driver, timeout=10)
         self.take_screenshot(driver, "12_htmx_second_click")
         
         # Step 8: Test responsive behavior
         print("🔍 Step 8: Testing responsive design...")
         
         # Test mobile view
-        driver.set_window_size(375, 667)  # iPhone size
-        time.sleep(0.5)
+        self.set_viewport_size(driver, 375, 667, mobile=True)  # iPhone size
         self.take_screenshot(driver, "13_mobile_view")
         
         # Test tablet view
-        driver.set_window_size(768, 1024)  # iPad size
-        time.sleep(0.5)
+        self.set_viewport_size(driver, 768, 1024, mobile=True)  # iPad size
         self.take_screenshot(driver, "14_tablet_view")
         
         # Return to desktop view
-        driver.maximize_window()
-        time.sleep(0.5)
+        self.reset_viewport_size(driver)
         self.take_screenshot(driver, "15_desktop_view_restored")
         
         # Step 9: Scroll behavior test
@@ -130,12 +121,18 @@ class TestFullDemoWithScreenshots(BaseSeleniumTest):
         
         # Scroll to bottom
         driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(0.5)
+        WebDriverWait(driver, 2).until(
+            lambda d: d.execute_script(
+                "return Math.ceil(window.scrollY + window.innerHeight) >= document.body.scrollHeight"
+            )
+        )
         self.take_screenshot(driver, "16_scrolled_to_bottom")
         
         # Scroll to top
         driver.execute_script("window.scrollTo(0, 0);")
-        time.sleep(0.5)
+        WebDriverWait(driver, 2).until(
+            lambda d: d.execute_script("return window.scrollY") == 0
+        )
         self.take_screenshot(driver, "17_scrolled_to_top")
         
         # Step 10: Final verification
@@ -157,23 +154,18 @@ class TestFullDemoWithScreenshots(BaseSeleniumTest):
         
         # Navigate to homepage
         driver.get(f"{live_server.url}")
-        self.wait_for_page_load(driver)
+        self.wait_for_homepage_ready(driver)
         self.take_screenshot(driver, "error_test_01_homepage")
         
-        # Test JavaScript console errors
-        logs = driver.get_log('browser')
-        console_errors = [log for log in logs if log['level'] == 'SEVERE']
-        
-        self.take_screenshot(driver, "error_test_02_console_check")
-        
         # Navigate to non-existent page
         driver.get(f"{live_server.url}/non-existent-page/")
-        self.take_screenshot(driver, "error_test_03_404_page")
+        self.wait_for_page_load(driver)
+        self.take_screenshot(driver, "error_test_02_404_page")
         
         # Go back to homepage
         driver.get(f"{live_server.url}")
-        self.wait_for_page_load(driver)
-        self.take_screenshot(driver, "error_test_04_back_to_homepage")
+        self.wait_for_homepage_ready(driver)
+        self.take_screenshot(driver, "error_test_03_back_to_homepage")
         
         print("✅ Error scenarios test completed!")
         
@@ -185,26 +177,27 @@ class TestFullDemoWithScreenshots(BaseSeleniumTest):
         # Navigate and measure load time
         start_time = time.time()
         driver.get(f"{live_server.url}")
-        self.wait_for_page_load(driver)
+        self.wait_for_homepage_ready(driver)
         load_time = time.time() - start_time
         
         self.take_screenshot(driver, f"perf_01_loaded_in_{load_time:.2f}s")
         
-        # Check if libraries are loaded
-        htmx_loaded = driver.execute_script("return typeof htmx !== 'undefined'")
-        alpine_loaded = driver.execute_script("return typeof Alpine !== 'undefined'")
-        
-        # Take screenshot showing performance metrics in console
-        driver.execute_script("""
-            console.log('HTMX Loaded:', typeof htmx !== 'undefined');
-            console.log('Alpine Loaded:', typeof Alpine !== 'undefined');
+        # Check if libraries are loaded and log the metrics to the console
+        libraries = driver.execute_script("""
+            const loaded = {
+                htmx: typeof htmx !== 'undefined',
+                alpine: typeof Alpine !== 'undefined'
+            };
+            console.log('HTMX Loaded:', loaded.htmx);
+            console.log('Alpine Loaded:', loaded.alpine);
             console.log('Load Time:', arguments[0] + 's');
+            return loaded;
         """, f"{load_time:.2f}")
         
         self.take_screenshot(driver, "perf_02_libraries_loaded")
         
-        assert htmx_loaded, "HTMX should be loaded"
-        assert alpine_loaded, "Alpine.js should be loaded"
+        assert libraries['htmx'], "HTMX should be loaded"
+        assert libraries['alpine'], "Alpine.js should be loaded"
         assert load_time < 10, f"Page should load within 10 seconds, took {load_time:.2f}s"
         
         print(f"✅ Performance test completed! Load time: {load_time:.2f}s")
\ No newline at end of file
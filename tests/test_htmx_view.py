@@ -0,0 +1,56 @@
+"""
+HTTP-level tests for the HTMX integration that do not need a browser.
+"""
+import re
+
+import pytest
+
+
+@pytest.mark.integration
+@pytest.mark.django_db
+class TestHTMXView:
+    """Test cases for HTMX markup and endpoints using the Django test client."""
+    
+    def test_htmx_library_loaded(self, client, homepage):
+        """Test that the homepage includes a versioned HTMX library."""
+        response = client.get('/')
+        assert response.status_code == 200
+        
+        # The HTMX script is pinned to a specific version in its URL
+        match = re.search(r'htmx\.org@v?(\d+\.\d+\.\d+)', response.content.decode())
+        assert match is not None, "HTMX library script not found"
+        
+    def test_htmx_request_attributes(self, client, homepage):
+        """Test that the HTMX demo button is wired to the demo endpoint."""
+        response = client.get('/')
+        assert response.status_code == 200
+        
+        button = re.search(
+            r'<button[^>]*data-testid="htmx-button"[^>]*>',
+            response.content.decode()
+        )
+        assert button is not None, "HTMX button not found"
+        
+        attributes = {
+            'hx-get': '/htmx-demo/',
+            'hx-target': '#htmx-result',
+            'hx-swap': 'innerHTML'
+        }
+        
+        for attr, expected_value in attributes.items():
+            assert f'{attr}="{expected_value}"' in button.group(0), f"{attr} mismatch: expected {expected_value}"
+            
+    def test_htmx_demo_view(self, client):
+        """Test that the HTMX demo endpoint returns the demo content."""
+        response = client.get('/htmx-demo/', HTTP_HX_REQUEST='true')
+        
+        assert response.status_code == 200
+        assert b'HTMX is working!' in response.content
+        
+    def test_htmx_demo_view_multiple_requests(self, client):
+        """Test that repeated HTMX requests return the same content."""
+        for i in range(3):
+            response = client.get('/htmx-demo/', HTTP_HX_REQUEST='true')
+            
+            assert response.status_code == 200
+            assert b'HTMX is working!' in response.content
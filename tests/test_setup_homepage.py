@@ -0,0 +1,62 @@
+"""
+Tests for the setup_homepage management command.
+"""
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from wagtail.models import Site
+
+from home.models import HomePage
+
+
+@pytest.mark.integration
+@pytest.mark.django_db
+class TestSetupHomepageCommand:
+    """Test cases for creating the HomePage and pointing the Site at it."""
+
+    def run_command(self):
+        call_command('setup_homepage', stdout=StringIO())
+
+    def test_running_twice_creates_one_homepage(self, wagtail_root):
+        """Test that the command is idempotent."""
+        self.run_command()
+        self.run_command()
+
+        assert HomePage.objects.count() == 1
+
+    def test_default_site_points_at_homepage(self, wagtail_root):
+        """Test that the default Site uses the HomePage as its root."""
+        self.run_command()
+
+        site = Site.objects.get(is_default_site=True)
+        assert site.root_page_id == HomePage.objects.get().id
+
+    def test_creates_default_site_when_missing(self, wagtail_root):
+        """Test that a default Site is created if none exists."""
+        Site.objects.all().delete()
+
+        self.run_command()
+
+        site = Site.objects.get(is_default_site=True)
+        assert site.hostname == 'localhost'
+        assert site.port == 8000
+        assert site.site_name == 'Amazon Manager'
+
+    def test_existing_site_keeps_hostname_and_port(self, wagtail_root):
+        """Test that only root_page is changed on an existing default Site."""
+        Site.objects.update_or_create(
+            is_default_site=True,
+            defaults={
+                'hostname': 'example.com',
+                'port': 8080,
+                'root_page': wagtail_root,
+            }
+        )
+
+        self.run_command()
+
+        site = Site.objects.get(is_default_site=True)
+        assert site.hostname == 'example.com'
+        assert site.port == 8080
+        assert site.root_page_id == HomePage.objects.get().id